@@ -1,11 +1,17 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Callable, List, Optional, Union
+from typing import Callable, List, Optional, Tuple, Union
 
 import numpy as np
 from numpy.typing import NDArray
 from qulacs import ParametricQuantumCircuit, QuantumState
 
+# Minimum batch size before run_many() spreads samples over a thread pool;
+# below this the pool setup outweighs the parallel circuit evaluations.
+_PARALLEL_THRESHOLD = 64
+
 
 class _Axis(Enum):
     """Specifying axis. Used in inner private method in LearningCircuit."""
@@ -132,6 +138,16 @@ class LearningCircuit:
     _input_parameter_list: List[_InputParameter] = field(
         init=False, default_factory=list
     )
+    # Lazily built (parameter_id, gate_pos, coef) arrays used to gather
+    # per-gate derivatives into per-parameter gradients without a Python loop.
+    _grad_gather_arrays: Optional[
+        Tuple[NDArray[np.int_], NDArray[np.int_], NDArray[np.float_]]
+    ] = field(init=False, default=None, compare=False)
+    # Lazily built (parameter_id, gate_pos, coef) arrays covering every
+    # learning parameter, used by update_parameters().
+    _param_update_arrays: Optional[
+        Tuple[NDArray[np.int_], List[int], NDArray[np.float_]]
+    ] = field(init=False, default=None, compare=False)
 
     def __post_init__(self) -> None:
         self._circuit = ParametricQuantumCircuit(self.n_qubit)
@@ -142,14 +158,32 @@ class LearningCircuit:
         Args:
             theta: New learning parameters.
         """
+        theta_arr = np.asarray(theta)
         for parameter in self._learning_parameter_list:
-            parameter_value = theta[parameter.parameter_id]
-            parameter.value = parameter_value
-            for pos in parameter.positions_in_circuit:
-                self._circuit.set_parameter(
-                    pos.gate_pos,
-                    parameter_value * (pos.coef or 1.0),
-                )
+            parameter.value = theta_arr[parameter.parameter_id]
+
+        # qulacs exposes no bulk parameter setter, so set_parameter must be
+        # called per gate; precompute the gate angles in one vectorized
+        # multiply and keep the loop itself free of Python-level arithmetic.
+        if self._param_update_arrays is None:
+            ids: List[int] = []
+            positions: List[int] = []
+            coefs: List[float] = []
+            for parameter in self._learning_parameter_list:
+                for pos in parameter.positions_in_circuit:
+                    ids.append(parameter.parameter_id)
+                    positions.append(pos.gate_pos)
+                    coefs.append(pos.coef or 1.0)
+            self._param_update_arrays = (
+                np.array(ids, dtype=np.int64),
+                positions,
+                np.array(coefs),
+            )
+        ids_arr, gate_positions, coef_arr = self._param_update_arrays
+        values = theta_arr[ids_arr] * coef_arr
+        set_parameter = self._circuit.set_parameter
+        for gate_pos, value in zip(gate_positions, values):
+            set_parameter(gate_pos, value)
 
     def get_parameters(self) -> List[float]:
         """Get a list of learning parameters' values."""
@@ -157,6 +191,10 @@ class LearningCircuit:
         return theta_list
 
     def _set_input(self, x: NDArray[np.float_]) -> None:
+        # This runs once per sample per circuit evaluation; hoist the
+        # attribute lookups out of the loop.
+        set_parameter = self._circuit.set_parameter
+        learning_parameter_list = self._learning_parameter_list
         for parameter in self._input_parameter_list:
             # Input parameter is updated here, not update_parameters(),
             # because input parameter is determined with the input data `x`.
@@ -164,10 +202,10 @@ class LearningCircuit:
                 # If `companion_parameter_id` is `None`, `func` does not need a learning parameter.
                 angle = parameter.func(x)
             else:
-                theta = self._learning_parameter_list[parameter.companion_parameter_id]
+                theta = learning_parameter_list[parameter.companion_parameter_id]
                 angle = parameter.func(theta.value, x)
                 theta.value = angle
-            self._circuit.set_parameter(parameter.pos, angle)
+            set_parameter(parameter.pos, angle)
 
     def run(self, x: List[float] = list()) -> QuantumState:
         """Determine parameters for input gate based on `x` and apply the circuit to |0> state.
@@ -184,6 +222,66 @@ class LearningCircuit:
         self._circuit.update_quantum_state(state)
         return state
 
+    def run_with_state(self, x: List[float], state: QuantumState) -> None:
+        """Variant of `run()` which reuses a caller-allocated state.
+
+        `state` is reset to |0> before the circuit is applied, so a single
+        `QuantumState` can be shared across repeated evaluations instead of
+        allocating a fresh state vector for every call.
+
+        Arguments:
+            x: Input data whose shape is (n_features,).
+            state: State to be overwritten with the circuit output.
+        """
+        state.set_zero_state()
+        self._set_input(x)
+        self._circuit.update_quantum_state(state)
+
+    def run_many(self, x_list: NDArray[np.float_]) -> NDArray[np.complex128]:
+        """Compute the output state vectors for a batch of inputs.
+
+        Samples are independent, so large batches are spread over a thread
+        pool; qulacs' C++ kernels release the GIL while updating the state.
+        Each worker runs on its own copy of the underlying circuit because
+        input parameters are written into the circuit before every run.
+
+        Arguments:
+            x_list: Input data whose shape is (n_samples, n_features).
+
+        Returns:
+            Array of output state vectors whose shape is (n_samples, 2^n_qubit).
+        """
+        out = np.empty((len(x_list), 2**self.n_qubit), dtype=np.complex128)
+        n_workers = min(os.cpu_count() or 1, len(x_list))
+        # Input parameters sharing a learning parameter update its value as a
+        # side effect of _set_input(), which is not thread-safe; keep those
+        # circuits on the serial path.
+        has_companion = any(
+            p.companion_parameter_id is not None for p in self._input_parameter_list
+        )
+        if n_workers <= 1 or has_companion or len(x_list) < _PARALLEL_THRESHOLD:
+            state = QuantumState(self.n_qubit)
+            for i in range(len(x_list)):
+                self.run_with_state(x_list[i], state)
+                out[i] = state.get_vector()
+            return out
+
+        def run_chunk(indices: NDArray[np.int_]) -> None:
+            circuit = self._circuit.copy()
+            state = QuantumState(self.n_qubit)
+            for i in indices:
+                for parameter in self._input_parameter_list:
+                    circuit.set_parameter(parameter.pos, parameter.func(x_list[i]))
+                state.set_zero_state()
+                circuit.update_quantum_state(state)
+                out[i] = state.get_vector()
+
+        chunks = np.array_split(np.arange(len(x_list)), n_workers)
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            # Consume the iterator so worker exceptions propagate.
+            list(executor.map(run_chunk, chunks))
+        return out
+
     def run_x_no_change(self) -> QuantumState:
         """
         Run the circuit while x is not changed from the previous run.
@@ -194,9 +292,9 @@ class LearningCircuit:
         self._circuit.update_quantum_state(state)
         return state
 
-    def backprop(self, x: List[float], obs) -> List[float]:
+    def backprop(self, x: List[float], obs) -> NDArray[np.float_]:
         """
-        backprop(self, x: List[float], obs)->List[Float]
+        backprop(self, x: List[float], obs)->NDArray[np.float_]
 
         xは入力の状態で、yは出力値の微分値
         帰ってくるのは、それぞれのパラメータに関する微分値
@@ -211,29 +309,45 @@ class LearningCircuit:
         現実だと不可能な演算も含むが、気にしない
         """
         self._set_input(x)
-        ret = self._circuit.backprop(obs)
-        ans = [0.0] * len(self._learning_parameter_list)
-        for parameter in self._learning_parameter_list:
-            if not parameter.is_input:
-                for pos in parameter.positions_in_circuit:
-                    ans[parameter.parameter_id] += ret[pos.gate_pos] * (pos.coef or 1.0)
+        ret = np.asarray(self._circuit.backprop(obs))
+        return self._gather_gradients(ret)
 
-        return ans
-
-    def backprop_inner_product(self, x: List[float], state) -> List[float]:
+    def backprop_inner_product(self, x: List[float], state) -> NDArray[np.float_]:
         """
-        backprop(self, x: List[float],  state)->List[Float]
+        backprop(self, x: List[float],  state)->NDArray[np.float_]
 
         inner_productでbackpropします。
         """
         self._set_input(x)
-        ret = self._circuit.backprop_inner_product(state)
-        ans = [0.0] * len(self._learning_parameter_list)
-        for parameter in self._learning_parameter_list:
-            if not parameter.is_input:
-                for pos in parameter.positions_in_circuit:
-                    ans[parameter.parameter_id] += ret[pos.gate_pos] * (pos.coef or 1.0)
-
+        ret = np.asarray(self._circuit.backprop_inner_product(state))
+        return self._gather_gradients(ret)
+
+    def _gather_gradients(self, ret: NDArray[np.float_]) -> NDArray[np.float_]:
+        """Reduce per-gate derivatives `ret` to per-parameter gradients.
+
+        Uses cached flat index/coefficient arrays and one scatter-add instead
+        of looping over `_learning_parameter_list` in Python.
+        """
+        if self._grad_gather_arrays is None:
+            ids: List[int] = []
+            positions: List[int] = []
+            coefs: List[float] = []
+            for parameter in self._learning_parameter_list:
+                if not parameter.is_input:
+                    for pos in parameter.positions_in_circuit:
+                        ids.append(parameter.parameter_id)
+                        positions.append(pos.gate_pos)
+                        coefs.append(pos.coef or 1.0)
+            self._grad_gather_arrays = (
+                np.array(ids, dtype=np.int64),
+                np.array(positions, dtype=np.int64),
+                np.array(coefs),
+            )
+        ids_arr, pos_arr, coef_arr = self._grad_gather_arrays
+        ans = np.zeros(len(self._learning_parameter_list))
+        # np.add.at accumulates correctly when a parameter is shared by
+        # multiple gates (repeated parameter_id).
+        np.add.at(ans, ids_arr, ret[pos_arr] * coef_arr)
         return ans
 
     def _new_parameter_position(self) -> int:
@@ -475,6 +589,8 @@ class LearningCircuit:
         share_with_coef: Optional[float],
     ) -> int:
         new_gate_pos = self._new_parameter_position()
+        self._grad_gather_arrays = None
+        self._param_update_arrays = None
 
         if share_with is None:
             parameter_id = len(self._learning_parameter_list)
@@ -529,6 +645,8 @@ class LearningCircuit:
         input_func: InputFuncWithParam,
     ) -> None:
         pos = self._circuit.get_parameter_count()
+        self._grad_gather_arrays = None
+        self._param_update_arrays = None
 
         learning_parameter = _LearningParameter(
             len(self._learning_parameter_list), parameter, True
@@ -1,11 +1,12 @@
-from functools import reduce
 from math import factorial
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 from numpy.random import Generator, default_rng
 from numpy.typing import NDArray
 from qulacs.gate import CNOT, CZ, DenseMatrix
+from scipy.sparse import csr_matrix
+from scipy.sparse.linalg import expm_multiply
 
 from .circuit import LearningCircuit
 
@@ -54,6 +55,18 @@ def create_qcl_ansatz(
     return circuit
 
 
+# From this qubit count on, the time evolution operator is computed through
+# the sparse Hamiltonian instead of a dense eigendecomposition; the Ising
+# Hamiltonian has only (n_qubit + 1) * 2^n_qubit nonzeros, so sparse
+# exponentiation scales far better than the O(8^n) dense eigh.
+_SPARSE_EVOLUTION_MIN_QUBITS = 10
+
+# Cache of time evolution operators keyed by (n_qubit, time_step, seed).
+# The Hamiltonian and its diagonalization are deterministic for a given seed,
+# so repeated ansatz constructions can reuse the computed propagator.
+_time_evol_op_cache: Dict[Tuple[int, float, Optional[int]], NDArray[np.complex128]] = {}
+
+
 def _create_time_evol_gate(
     n_qubit, time_step=0.77, rng: Generator = None, seed: Optional[int] = 0
 ):
@@ -66,16 +79,32 @@ def _create_time_evol_gate(
     Return:
         qulacs' gate object
     """
-    if rng is None:
-        rng = default_rng(seed)
-
-    ham = _make_hamiltonian(n_qubit, rng)
-    # Create time evolution operator by diagonalization.
-    # H*P = P*D <-> H = P*D*P^dagger
-    diag, eigen_vecs = np.linalg.eigh(ham)
-    time_evol_op = np.dot(
-        np.dot(eigen_vecs, np.diag(np.exp(-1j * time_step * diag))), eigen_vecs.T.conj()
-    )  # e^-iHT
+    # Only seed-determined operators are cached; a caller-supplied rng has
+    # its own stream state, so its result is not reproducible from the key.
+    cache_key = (n_qubit, time_step, seed) if rng is None else None
+    time_evol_op = _time_evol_op_cache.get(cache_key) if cache_key else None
+    if time_evol_op is None:
+        if rng is None:
+            rng = default_rng(seed)
+
+        if n_qubit >= _SPARSE_EVOLUTION_MIN_QUBITS:
+            # Compute e^-iHT column by column from the sparse Hamiltonian,
+            # avoiding both the dense matrix and its eigendecomposition.
+            ham_sparse = _make_hamiltonian_sparse(n_qubit, rng)
+            time_evol_op = expm_multiply(
+                -1j * time_step * ham_sparse, np.eye(2**n_qubit, dtype=complex)
+            )
+        else:
+            ham = _make_hamiltonian(n_qubit, rng)
+            # Create time evolution operator by diagonalization.
+            # H*P = P*D <-> H = P*D*P^dagger
+            diag, eigen_vecs = np.linalg.eigh(ham)
+            time_evol_op = np.dot(
+                np.dot(eigen_vecs, np.diag(np.exp(-1j * time_step * diag))),
+                eigen_vecs.T.conj(),
+            )  # e^-iHT
+        if cache_key:
+            _time_evol_op_cache[cache_key] = time_evol_op
 
     # Convert to a qulacs gate
     time_evol_gate = DenseMatrix([i for i in range(n_qubit)], time_evol_op)
@@ -84,37 +113,76 @@ def _create_time_evol_gate(
 
 
 def _make_hamiltonian(n_qubit, rng: Generator = None, seed: Optional[int] = 0):
+    """Build the transverse field Ising Hamiltonian with random couplings.
+
+    Each term is filled in directly through the bit structure of the basis
+    indices instead of materializing full Kronecker products per term:
+    X_i couples every basis state `idx` with the state whose i-th qubit is
+    flipped, and Z_i Z_j is diagonal with sign s_i * s_j where s_k = +-1 is
+    read off qubit k of the basis state. Qubit i occupies bit
+    n_qubit - 1 - i of the matrix index, matching the Kronecker ordering
+    I(0) * ... * O(i) * ... used before.
+    """
     if rng is None:
         rng = default_rng(seed)
-    X_mat = np.array([[0, 1], [1, 0]])
-    Z_mat = np.array([[1, 0], [0, -1]])
-    ham = np.zeros((2**n_qubit, 2**n_qubit), dtype=complex)
+    # X and ZZ terms have real coefficients, so the Hamiltonian is kept real
+    # symmetric; eigh then factorizes it in the real domain, which is cheaper
+    # than the complex Hermitian path.
+    basis = np.arange(2**n_qubit)
+    ham = np.zeros((2**n_qubit, 2**n_qubit))
+    # One batched draw replaces O(n^2) scalar rng.uniform() calls; a
+    # Generator fills the batch from the same stream as sequential draws,
+    # so the coefficients are unchanged for a given rng/seed.
+    coefs = rng.uniform(-1.0, 1.0, n_qubit * (n_qubit + 1) // 2)
+    cnt = 0
     for i in range(n_qubit):
-        Jx = rng.uniform(-1.0, 1.0)
-        ham += Jx * _make_fullgate([[i, X_mat]], n_qubit)
+        Jx = coefs[cnt]
+        cnt += 1
+        ham[basis, basis ^ (1 << (n_qubit - 1 - i))] += Jx
+        s_i = 1 - 2 * ((basis >> (n_qubit - 1 - i)) & 1)
         for j in range(i + 1, n_qubit):
-            J_ij = rng.uniform(-1.0, 1.0)
-            ham += J_ij * _make_fullgate([[i, Z_mat], [j, Z_mat]], n_qubit)
+            J_ij = coefs[cnt]
+            cnt += 1
+            s_j = 1 - 2 * ((basis >> (n_qubit - 1 - j)) & 1)
+            ham[basis, basis] += J_ij * s_i * s_j
     return ham
 
 
-def _make_fullgate(list_SiteAndOperator, n_qubit):
-    """
-    Receive `list_SiteAndOperator = [ [i_0, O_0], [i_1, O_1], ...]` and
-    insert identity to qubits which is not present in the list to create (2**n_qubit, 2**n_qubit) matrix
-    I(0) * ... * O_0(i_0) * ... * O_1(i_1) ...
+def _make_hamiltonian_sparse(n_qubit, rng: Generator = None, seed: Optional[int] = 0):
+    """Sparse variant of `_make_hamiltonian`.
+
+    Produces the same operator in CSR form without ever materializing the
+    dense matrix; coefficients are drawn in the same order, so for equal
+    rng/seed the two builders yield identical Hamiltonians.
     """
-    I_mat = np.eye(2, dtype=complex)
-    list_Site = [SiteAndOperator[0] for SiteAndOperator in list_SiteAndOperator]
-    list_SingleGates = []
+    if rng is None:
+        rng = default_rng(seed)
+    basis = np.arange(2**n_qubit)
+    rows = []
+    cols = []
+    data = []
+    diag = np.zeros(2**n_qubit)
+    coefs = rng.uniform(-1.0, 1.0, n_qubit * (n_qubit + 1) // 2)
     cnt = 0
     for i in range(n_qubit):
-        if i in list_Site:
-            list_SingleGates.append(list_SiteAndOperator[cnt][1])
+        Jx = coefs[cnt]
+        cnt += 1
+        rows.append(basis)
+        cols.append(basis ^ (1 << (n_qubit - 1 - i)))
+        data.append(np.full(2**n_qubit, Jx))
+        s_i = 1 - 2 * ((basis >> (n_qubit - 1 - i)) & 1)
+        for j in range(i + 1, n_qubit):
+            J_ij = coefs[cnt]
             cnt += 1
-        else:
-            list_SingleGates.append(I_mat)
-    return reduce(np.kron, list_SingleGates)
+            s_j = 1 - 2 * ((basis >> (n_qubit - 1 - j)) & 1)
+            diag += J_ij * s_i * s_j
+    rows.append(basis)
+    cols.append(basis)
+    data.append(diag)
+    return csr_matrix(
+        (np.concatenate(data), (np.concatenate(rows), np.concatenate(cols))),
+        shape=(2**n_qubit, 2**n_qubit),
+    )
 
 
 def create_farhi_neven_ansatz(
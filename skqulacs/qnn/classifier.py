@@ -58,6 +58,7 @@ class QNNClassifier:
     observables: List[Observable] = field(init=False)
     n_qubit: int = field(init=False)
     x_scaler: MinMaxScaler = field(init=False)
+    _z_signs: NDArray[np.int8] = field(init=False)
 
     def __post_init__(self) -> None:
         self.n_qubit = self.circuit.n_qubit
@@ -65,6 +66,19 @@ class QNNClassifier:
         for i in range(self.n_qubit):
             self.observables[i].add_operator(1.0, f"Z {i}")
 
+        # <Z_k> can be read off the Z-basis probabilities: basis state i
+        # contributes +p_i if bit k of i is 0 and -p_i otherwise. Precompute
+        # the sign table so every observable is evaluated with a single
+        # matrix-vector product per sample instead of num_class
+        # get_expectation_value() calls. The entries are only +-1, so int8
+        # keeps the table at one byte per basis state and qubit; it is
+        # promoted to float64 when multiplied with the probabilities.
+        basis = np.arange(2**self.n_qubit)
+        self._z_signs = (
+            1
+            - 2 * ((basis[np.newaxis, :] >> np.arange(self.n_qubit)[:, np.newaxis]) & 1)
+        ).astype(np.int8)
+
         if self.do_x_scale:
             self.scale_x_scaler = MinMaxScaler(
                 feature_range=(-self.x_norm_range, self.x_norm_range)
@@ -125,13 +139,11 @@ class QNNClassifier:
         return y_pred
 
     def _predict_inner(self, x_list: NDArray[np.float_]) -> NDArray[np.float_]:
-        res = np.zeros((len(x_list), self.num_class))
-        for i in range(len(x_list)):
-            state = self.circuit.run(x_list[i])
-            for j in range(self.num_class):
-                res[i][j] = (
-                    self.observables[j].get_expectation_value(state) * self.y_exp_ratio
-                )
+        vecs = self.circuit.run_many(x_list)
+        probs = vecs.real**2 + vecs.imag**2
+        res: NDArray[np.float_] = (
+            probs @ self._z_signs[: self.num_class].T
+        ) * self.y_exp_ratio
         return res
 
     # TODO: Extract cost function to outer class to accept other type of ones.
@@ -161,19 +173,23 @@ class QNNClassifier:
 
         y_pred = self._predict_inner(x_scaled)
         y_pred_sm = softmax(y_pred, axis=1)
+        # Coefficient of Z_k in the observable backpropagated for each sample is
+        # (softmax(y_pred)_k - onehot(y)_k) * y_exp_ratio; compute them for all
+        # samples and classes at once instead of branching per class in the loop.
+        coefs = y_pred_sm * self.y_exp_ratio
+        coefs[np.arange(len(x_scaled)), y_scaled] -= self.y_exp_ratio
         grad = np.zeros(len(theta))
+        n_qubit = self.n_qubit
+        num_class = self.num_class
+        backprop = self.circuit.backprop
         for sample_index in range(len(x_scaled)):
-            backobs = Observable(self.n_qubit)
-            for current_class in range(self.num_class):
-                expected = 0.0
-                if current_class == y_scaled[sample_index]:
-                    expected = 1.0
+            backobs = Observable(n_qubit)
+            for current_class in range(num_class):
                 backobs.add_operator(
-                    (-expected + y_pred_sm[sample_index][current_class])
-                    * self.y_exp_ratio,
+                    coefs[sample_index][current_class],
                     f"Z {current_class}",
                 )
-            grad += self.circuit.backprop(x_scaled[sample_index], backobs)
+            grad += backprop(x_scaled[sample_index], backobs)
 
         grad /= len(x_scaled)
         return grad
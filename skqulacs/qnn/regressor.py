@@ -5,7 +5,7 @@ from typing import List, Optional, Tuple
 
 import numpy as np
 from numpy.typing import NDArray
-from qulacs import Observable
+from qulacs import Observable, QuantumState
 from sklearn.metrics import mean_squared_error
 from sklearn.preprocessing import MinMaxScaler
 from typing_extensions import Literal
@@ -144,15 +144,20 @@ class QNNRegressor:
         return y_pred
 
     def _predict_inner(self, x_scaled: NDArray[np.float_]) -> NDArray[np.float_]:
-        res = []
-        for x in x_scaled:
-            state = self.circuit.run(x)
-            r = [
-                self.observables[i].get_expectation_value(state)
-                for i in range(self.n_outputs)
-            ]
-            res.append(r)
-        return np.array(res)
+        # The output shape is known up front; fill a preallocated array
+        # instead of growing Python lists and converting at the end.
+        res = np.empty((len(x_scaled), self.n_outputs))
+        # Reuse one state for the whole batch instead of allocating a fresh
+        # 2^n state vector per sample; keep loop-invariant lookups local.
+        state = QuantumState(self.n_qubit)
+        run_with_state = self.circuit.run_with_state
+        observables = self.observables
+        n_outputs = self.n_outputs
+        for h in range(len(x_scaled)):
+            run_with_state(x_scaled[h], state)
+            for i in range(n_outputs):
+                res[h][i] = observables[i].get_expectation_value(state)
+        return res
 
     def cost_func(
         self,
@@ -179,20 +184,23 @@ class QNNRegressor:
     ) -> NDArray[np.float_]:
         self.circuit.update_parameters(theta)
 
-        mto = self._predict_inner(x_scaled).copy()
+        mto = self._predict_inner(x_scaled)
 
         grad = np.zeros(len(theta))
 
+        n_qubit = self.n_qubit
+        n_outputs = self.n_outputs
+        backprop = self.circuit.backprop
         for h in range(len(x_scaled)):
-            backobs = Observable(self.n_qubit)
-            if self.n_outputs >= 2:
-                for i in range(self.n_outputs):
+            backobs = Observable(n_qubit)
+            if n_outputs >= 2:
+                for i in range(n_outputs):
                     backobs.add_operator(
-                        (-y_scaled[h][i] + mto[h][i]) / self.n_outputs, f"Z {i}"
+                        (-y_scaled[h][i] + mto[h][i]) / n_outputs, f"Z {i}"
                     )
             else:
-                backobs.add_operator((-y_scaled[h] + mto[h][0]) / self.n_outputs, "Z 0")
-            grad += self.circuit.backprop(x_scaled[h], backobs)
+                backobs.add_operator((-y_scaled[h] + mto[h][0]) / n_outputs, "Z 0")
+            grad += backprop(x_scaled[h], backobs)
 
         grad /= len(x_scaled)
         return grad
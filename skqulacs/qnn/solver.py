@@ -84,6 +84,34 @@ class Bfgs(Solver):
         return loss, theta_opt
 
 
+@dataclass
+class LBfgsB(Solver):
+    """L-BFGS-B keeps only a limited-memory Hessian approximation, so each
+    iteration is cheaper than BFGS for circuits with many parameters while
+    still using the analytic gradient."""
+
+    def run(
+        self,
+        cost_func: CostFunc,
+        jac: Jacobian,
+        theta: List[float],
+        x: NDArray[np.float_],
+        y: NDArray[np.float_],
+        maxiter: Optional[int],
+    ) -> Tuple[float, List[float]]:
+        result = minimize(
+            cost_func,
+            theta,
+            args=(x, y),
+            method="L-BFGS-B",
+            jac=jac,
+            options={"maxiter": maxiter},
+        )
+        loss = result.fun
+        theta_opt = result.x
+        return loss, theta_opt
+
+
 @dataclass
 class Adam(Solver):
     callback: Optional[Callable[[List[float]], None]] = None
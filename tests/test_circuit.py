@@ -1,3 +1,9 @@
+import numpy as np
+import pytest
+from numpy.random import default_rng
+
+import skqulacs.circuit.circuit as circuit_module
+import skqulacs.circuit.pre_defined as pre_defined_module
 from skqulacs.circuit import LearningCircuit
 
 
@@ -87,3 +93,68 @@ def test_share_coef_input_learning_parameter() -> None:
     state_without_share = circuit_without_share.run([])
     for v, w in zip(state.get_vector(), state_without_share.get_vector()):
         assert v == w
+
+
+def test_run_many_parallel_matches_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Force the threaded branch even on single-core machines.
+    monkeypatch.setattr(circuit_module, "_PARALLEL_THRESHOLD", 2)
+    monkeypatch.setattr(circuit_module.os, "cpu_count", lambda: 2)
+
+    circuit = LearningCircuit(2)
+    circuit.add_input_RX_gate(0)
+    circuit.add_input_RY_gate(1, lambda x: 2.0 * x[0])
+    circuit.add_parametric_RX_gate(0, 0.1)
+    circuit.add_parametric_RY_gate(1, 0.2)
+
+    x_list = np.linspace(-1.0, 1.0, 8).reshape(-1, 1)
+    vecs = circuit.run_many(x_list)
+    expected = np.array([circuit.run(x).get_vector() for x in x_list])
+    assert np.allclose(vecs, expected)
+
+
+def test_sparse_hamiltonian_matches_dense() -> None:
+    for n_qubit in (3, 6):
+        dense = pre_defined_module._make_hamiltonian(n_qubit, default_rng(0))
+        sparse = pre_defined_module._make_hamiltonian_sparse(n_qubit, default_rng(0))
+        assert np.array_equal(sparse.toarray(), dense)
+
+
+def test_sparse_time_evol_matches_eigh(monkeypatch: pytest.MonkeyPatch) -> None:
+    n_qubit = 6
+    time_step = 0.5
+    # Passing an rng bypasses the operator cache, so each call rebuilds the
+    # propagator through the path selected by the threshold.
+    monkeypatch.setattr(pre_defined_module, "_SPARSE_EVOLUTION_MIN_QUBITS", n_qubit)
+    sparse_op = pre_defined_module._create_time_evol_gate(
+        n_qubit, time_step, rng=default_rng(0)
+    ).get_matrix()
+    monkeypatch.setattr(pre_defined_module, "_SPARSE_EVOLUTION_MIN_QUBITS", n_qubit + 1)
+    dense_op = pre_defined_module._create_time_evol_gate(
+        n_qubit, time_step, rng=default_rng(0)
+    ).get_matrix()
+    assert np.allclose(sparse_op, dense_op)
+
+
+def test_run_many_companion_parameter_stays_serial(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(circuit_module, "_PARALLEL_THRESHOLD", 2)
+    monkeypatch.setattr(circuit_module.os, "cpu_count", lambda: 2)
+
+    def forbidden_executor(*args: object, **kwargs: object) -> None:
+        raise AssertionError(
+            "run_many must stay serial when an input gate shares a learning parameter"
+        )
+
+    monkeypatch.setattr(circuit_module, "ThreadPoolExecutor", forbidden_executor)
+
+    circuit = LearningCircuit(2)
+    # The companion parameter's value is overwritten with x[0] on every run,
+    # so each sample's result does not depend on the evaluation order.
+    circuit.add_parametric_input_RX_gate(1, 0.5, lambda theta, x: x[0])
+    circuit.add_parametric_RY_gate(0, 0.3)
+
+    x_list = np.linspace(-1.0, 1.0, 8).reshape(-1, 1)
+    vecs = circuit.run_many(x_list)
+    expected = np.array([circuit.run(x).get_vector() for x in x_list])
+    assert np.allclose(vecs, expected)
@@ -9,7 +9,7 @@ from sklearn.metrics import mean_squared_error
 
 from skqulacs.circuit import create_qcl_ansatz
 from skqulacs.qnn import QNNRegressor
-from skqulacs.qnn.solver import Adam, Bfgs, Solver
+from skqulacs.qnn.solver import Adam, Bfgs, LBfgsB, Solver
 
 
 def generate_noisy_data(
@@ -95,7 +95,7 @@ def sine(x: NDArray[np.float_]) -> NDArray[np.float_]:
 
 @pytest.mark.parametrize(
     ("solver", "maxiter"),
-    [(Bfgs(), 20), (Adam(tolerance=2e-4, n_iter_no_change=8), 777)],
+    [(Bfgs(), 20), (LBfgsB(), 20), (Adam(tolerance=2e-4, n_iter_no_change=8), 777)],
 )
 def test_noisy_sine(solver: Solver, maxiter: int) -> None:
     x_min = -1.0